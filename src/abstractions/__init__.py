@@ -1,3 +1,36 @@
 """Azure service abstractions for AI Foundry agent integration."""
 
-__all__ = ["AzureFunctionsClient", "LogicAppsClient"]
+from importlib import import_module
+from typing import Any, List
+
+__all__ = [
+    "AzureFunctionsClient",
+    "LogicAppsClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+]
+
+# Re-exports are resolved on first access (PEP 562) so importing the package
+# does not pull aiohttp, requests and azure-identity onto the startup path.
+_LAZY_EXPORTS = {
+    "AzureFunctionsClient": ".azure_functions",
+    "LogicAppsClient": ".logic_apps",
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitOpenError": ".circuit_breaker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported client class on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in dir() for tooling."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,13 +5,19 @@ This module provides a client for invoking Azure Functions as tools
 within an AI Foundry agent workflow.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
+import orjson
 import requests
 from azure.identity import DefaultAzureCredential
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .circuit_breaker import CircuitBreaker
+from .http_client import URL_SCHEMES, PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,8 @@ class FunctionConfig(BaseModel):
         timeout: Request timeout in seconds.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     function_url: str = Field(..., description="Azure Function HTTP endpoint URL")
     function_key: Optional[str] = Field(
         None, description="Function key for authentication"
@@ -39,12 +47,12 @@ class FunctionConfig(BaseModel):
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Validate that the URL is properly formatted."""
-        if not v.startswith(("http://", "https://")):
+        if not v.startswith(URL_SCHEMES):
             raise ValueError("function_url must start with http:// or https://")
         return v
 
 
-class AzureFunctionsClient:
+class AzureFunctionsClient(PooledHttpClient):
     """Client for interacting with Azure Functions.
 
     This client provides both synchronous and asynchronous methods for
@@ -60,15 +68,29 @@ class AzureFunctionsClient:
         >>> result = client.invoke_function({"data": "test"})
     """
 
-    def __init__(self, config: FunctionConfig) -> None:
+    def __init__(
+        self,
+        config: FunctionConfig,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         """Initialize the Azure Functions client.
 
         :param config: Configuration object containing function endpoint and authentication settings.
+        :param circuit_breaker: Breaker guarding calls to the function. A new one
+            with default thresholds is created if not given.
         :raises ValueError: If configuration is invalid.
         """
         try:
             self.config = config
             self._credential: Optional[DefaultAzureCredential] = None
+            super().__init__(f"Azure Function {config.function_url}", circuit_breaker)
+
+            # The config is frozen, so the headers can be built once up front
+            headers = {"Content-Type": "application/json"}
+            if self.config.function_key:
+                headers["x-functions-key"] = self.config.function_key
+                logger.debug("Added function key to request headers")
+            self._headers: Mapping[str, str] = MappingProxyType(headers)
 
             if self.config.use_managed_identity:
                 self._credential = DefaultAzureCredential()
@@ -76,21 +98,15 @@ class AzureFunctionsClient:
             else:
                 logger.info("Initialized Azure Functions client with function key")
         except Exception as e:
-            logger.error(f"Failed to initialize Azure Functions client: {str(e)}")
+            logger.error("Failed to initialize Azure Functions client: %s", e)
             raise ValueError(f"Client initialization failed: {str(e)}") from e
 
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self) -> Mapping[str, str]:
         """Get HTTP headers for the request.
 
-        :return: Dictionary containing Content-Type and optional authentication headers.
+        :return: Read-only mapping containing Content-Type and optional authentication headers.
         """
-        headers = {"Content-Type": "application/json"}
-
-        if self.config.function_key:
-            headers["x-functions-key"] = self.config.function_key
-            logger.debug("Added function key to request headers")
-
-        return headers
+        return self._headers
 
     def invoke_function(
         self, payload: Dict[str, Any], method: str = "POST"
@@ -100,33 +116,40 @@ class AzureFunctionsClient:
         :param payload: JSON payload to send to the function.
         :param method: HTTP method to use for the request.
         :return: The JSON response from the function.
-        :raises requests.RequestException: If the HTTP request fails.
+        :raises CircuitOpenError: If recent failures have opened the circuit.
+        :raises requests.RequestException: If the payload cannot be serialized to
+            JSON (InvalidJSONError) or the HTTP request fails.
         :raises ValueError: If the response cannot be parsed as JSON.
         """
-        logger.info(f"Invoking Azure Function: {self.config.function_url}")
-        logger.debug(f"Request method: {method}, payload keys: {list(payload.keys())}")
+        logger.info("Invoking Azure Function: %s", self.config.function_url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request method: %s, payload keys: %s", method, list(payload))
+        body = self._encode_payload(payload)
+        self._check_circuit()
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=self.config.function_url,
-                json=payload,
+                data=body,
                 headers=self._get_headers(),
                 timeout=self.config.timeout,
             )
             response.raise_for_status()
+            self._breaker.record_success()
 
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info(
-                f"Function invocation successful. Status: {response.status_code}"
+                "Function invocation successful. Status: %s", response.status_code
             )
             return result
 
         except requests.RequestException as e:
-            logger.error(f"Failed to invoke Azure Function: {str(e)}")
+            self._breaker.record_failure(getattr(e.response, "status_code", None))
+            logger.error("Failed to invoke Azure Function: %s", e)
             raise
         except ValueError as e:
-            logger.error(f"Invalid JSON response from function: {str(e)}")
+            logger.error("Invalid JSON response from function: %s", e)
             raise
 
     async def invoke_function_async(
@@ -134,39 +157,47 @@ class AzureFunctionsClient:
     ) -> Dict[str, Any]:
         """Invoke an Azure Function asynchronously.
 
+        Unlike invoke_function, failed requests are not retried.
+
         :param payload: JSON payload to send to the function.
         :param method: HTTP method to use for the request.
         :return: The JSON response from the function.
+        :raises CircuitOpenError: If recent failures have opened the circuit.
         :raises aiohttp.ClientError: If the HTTP request fails.
+        :raises TypeError: If the payload cannot be serialized to JSON.
+        :raises asyncio.TimeoutError: If the request times out.
         :raises ValueError: If the response cannot be parsed as JSON.
         """
         logger.info(
-            f"Invoking Azure Function asynchronously: {self.config.function_url}"
+            "Invoking Azure Function asynchronously: %s", self.config.function_url
         )
-        logger.debug(f"Request method: {method}, payload keys: {list(payload.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request method: %s, payload keys: %s", method, list(payload))
+        self._check_circuit()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method,
-                    url=self.config.function_url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                ) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    logger.info(
-                        f"Async function invocation successful. Status: {response.status}"
-                    )
-                    return result
-
-        except aiohttp.ClientError as e:
-            logger.error(f"Failed to invoke Azure Function asynchronously: {str(e)}")
+            async with (await self._get_async_session()).request(
+                method=method,
+                url=self.config.function_url,
+                json=payload,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            ) as response:
+                response.raise_for_status()
+                self._breaker.record_success()
+                result = await response.json(loads=orjson.loads)
+
+                logger.info(
+                    "Async function invocation successful. Status: %s", response.status
+                )
+                return result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure(getattr(e, "status", None))
+            logger.error("Failed to invoke Azure Function asynchronously: %s", e)
             raise
         except ValueError as e:
-            logger.error(f"Invalid JSON response from function: {str(e)}")
+            logger.error("Invalid JSON response from function: %s", e)
             raise
 
 
@@ -210,7 +241,7 @@ class DataProcessorFunction:
             logger.info("Data processing completed successfully")
             return result
         except Exception as e:
-            logger.error(f"Data processing failed: {str(e)}")
+            logger.error("Data processing failed: %s", e)
             raise
 
 
@@ -253,14 +284,14 @@ class IntegrationFunction:
         Returns:
             Response from the external service.
         """
-        logger.info(f"Calling external service '{service}' through Azure Function")
+        logger.info("Calling external service '%s' through Azure Function", service)
 
         try:
             result = self.client.invoke_function(
                 {"service": service, "parameters": params}
             )
-            logger.info(f"External service call to '{service}' completed successfully")
+            logger.info("External service call to '%s' completed successfully", service)
             return result
         except Exception as e:
-            logger.error(f"External service call to '{service}' failed: {str(e)}")
+            logger.error("External service call to '%s' failed: %s", service, e)
             raise
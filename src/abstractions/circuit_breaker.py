@@ -0,0 +1,123 @@
+"""
+Circuit breaker for Azure service clients.
+
+This module provides a small thread-safe circuit breaker that the Azure
+Functions and Logic Apps clients use to stop calling a downstream service
+that keeps failing, instead of piling retries onto it.
+"""
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Enum for circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected without any network work. Once ``reset_timeout``
+    seconds have passed a single trial call is let through: success closes
+    the circuit, failure opens it again for another cooldown.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        >>> if breaker.allow_request():
+        ...     breaker.record_success()
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Initialize the circuit breaker.
+
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds to wait before letting a trial call through.
+        :raises ValueError: If either setting is not positive.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be positive")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        with self._lock:
+            if self._opened_at is None:
+                return CircuitState.CLOSED
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be made.
+
+        Letting the trial call through restarts the cooldown, so concurrent
+        callers keep being rejected until the trial reports back, and a trial
+        that never reports cannot wedge the circuit open.
+
+        :return: True if the call should proceed, False if it should be rejected.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+
+            self._opened_at = time.monotonic()
+            self._half_open = True
+            logger.info("Circuit half-open, allowing trial request")
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit closed after successful trial request")
+            self._failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def record_failure(self, status_code: Optional[int] = None) -> None:
+        """Record a failed call, opening the circuit if needed.
+
+        Client errors (4xx other than 429) show the service is reachable and
+        are recorded as successes rather than counting towards the threshold.
+
+        :param status_code: HTTP status of the failed response, or None for
+            connection errors and timeouts.
+        """
+        if status_code is not None and status_code < 500 and status_code != 429:
+            self.record_success()
+            return
+
+        with self._lock:
+            self._failures += 1
+            if self._half_open or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._half_open:
+                    logger.warning(
+                        "Circuit opened after %d consecutive failures", self._failures
+                    )
+                self._opened_at = time.monotonic()
+                self._half_open = False
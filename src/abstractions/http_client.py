@@ -0,0 +1,197 @@
+"""
+Shared HTTP plumbing for the Azure service clients.
+
+This module holds the session handling that the Azure Functions and Logic
+Apps clients have in common: a pooled requests session for synchronous
+calls, lazily created per-loop aiohttp sessions for asynchronous ones, and
+the circuit breaker check made before every call.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple, TypeVar
+
+import aiohttp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+URL_SCHEMES = ("http://", "https://")
+
+# Longest wait between retries, in seconds, whether from backoff or Retry-After
+_MAX_RETRY_WAIT = 30
+
+# Retry throttled/unavailable responses (honouring Retry-After up to the cap)
+# and failed connects with jittered exponential backoff. Read errors are not
+# retried because the POST may already have been processed. This applies to
+# the synchronous requests session only; async calls are not retried.
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    status_forcelist=(429, 503),
+    allowed_methods=None,
+    backoff_factor=1.0,
+    backoff_max=_MAX_RETRY_WAIT,
+    backoff_jitter=0.5,
+    retry_after_max=_MAX_RETRY_WAIT,
+    raise_on_status=False,
+)
+
+_ClientT = TypeVar("_ClientT", bound="PooledHttpClient")
+
+
+# Like the standard json module, serialize int/float/bool/None dict keys as
+# strings instead of rejecting them.
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize request bodies for aiohttp with orjson."""
+    return orjson.dumps(obj, option=JSON_OPTIONS).decode()
+
+
+def build_session() -> requests.Session:
+    """Create a pooled requests session that retries with RETRY_POLICY.
+
+    :return: A new session with the retrying adapter mounted for HTTP(S).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=RETRY_POLICY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class PooledHttpClient:
+    """Base class for clients that reuse pooled HTTP sessions.
+
+    Synchronous calls share one retrying requests session. Asynchronous calls
+    get one aiohttp session per event loop, since an aiohttp session can only
+    be used on the loop that created it; clients shared between threads or
+    across asyncio.run calls therefore never hand one loop's session to another.
+    """
+
+    def __init__(self, target: str, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """Set up the pooled sessions and circuit breaker.
+
+        :param target: Description of the remote service for log and error messages.
+        :param circuit_breaker: Breaker guarding calls to the service. A new one
+            with default thresholds is created if not given.
+        """
+        self._target = target
+        self._breaker = circuit_breaker or CircuitBreaker()
+        self._session = build_session()
+        self._async_sessions: Dict[
+            asyncio.AbstractEventLoop,
+            Tuple[aiohttp.ClientSession, AsyncGenerator[aiohttp.ClientSession, None]],
+        ] = {}
+        self._async_lock = threading.Lock()
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the pooled aiohttp session for the running event loop.
+
+        Sessions are created lazily because aiohttp binds them to the running
+        event loop, which does not exist yet when the client is constructed.
+
+        :return: The aiohttp session for the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            entry = self._async_sessions.get(loop)
+        if entry is not None:
+            return entry[0]
+
+        # The first step of the holder runs without suspending, so tasks on
+        # this loop cannot interleave and create a second session.
+        holder = self._hold_async_session(loop)
+        session = await holder.__anext__()
+        with self._async_lock:
+            self._async_sessions[loop] = (session, holder)
+        return session
+
+    async def _hold_async_session(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> AsyncGenerator[aiohttp.ClientSession, None]:
+        """Own one event loop's aiohttp session until aclose() or loop shutdown.
+
+        Event loops finalize pending async generators when they shut down
+        (asyncio.run does so before closing the loop), so the session is closed
+        on its own loop even if aclose() is never called there.
+
+        :param loop: The loop the session belongs to.
+        :return: Async generator yielding the session once.
+        """
+        session = aiohttp.ClientSession(json_serialize=json_dumps)
+        try:
+            yield session
+        finally:
+            with self._async_lock:
+                entry = self._async_sessions.get(loop)
+                if entry is not None and entry[0] is session:
+                    del self._async_sessions[loop]
+            await session.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session used for synchronous calls.
+
+        aiohttp sessions are left to aclose() or to their event loop's shutdown,
+        as they can only be closed on the loop that owns them.
+        """
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's aiohttp session and the synchronous session.
+
+        Sessions of other event loops are not touched; they are closed by
+        aclose() on their own loop or when that loop shuts down.
+        """
+        with self._async_lock:
+            entry = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+        self.close()
+
+    def _encode_payload(self, payload: Any) -> bytes:
+        """Serialize a request payload for the synchronous session.
+
+        :param payload: JSON-serializable request payload.
+        :return: The payload as JSON bytes.
+        :raises requests.exceptions.InvalidJSONError: If the payload cannot be
+            serialized to JSON.
+        """
+        try:
+            return orjson.dumps(payload, option=JSON_OPTIONS)
+        except TypeError as e:
+            logger.error("Payload for %s is not JSON serializable: %s", self._target, e)
+            raise requests.exceptions.InvalidJSONError(
+                f"Payload is not JSON serializable: {e}"
+            ) from e
+
+    def _check_circuit(self) -> None:
+        """Reject the call up front if the circuit breaker is open.
+
+        :raises CircuitOpenError: If recent failures have opened the circuit.
+        """
+        if not self._breaker.allow_request():
+            logger.warning("Circuit open, skipping call to %s", self._target)
+            raise CircuitOpenError(f"Circuit open for {self._target}")
@@ -5,17 +5,27 @@ This module provides a client for triggering Logic App workflows
 as tools within an AI Foundry agent workflow.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from enum import Enum
 
 import aiohttp
+import orjson
 import requests
 from azure.identity import DefaultAzureCredential
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .circuit_breaker import CircuitBreaker
+from .http_client import URL_SCHEMES, PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Trigger URLs carry their SAS signature, so every request sends the same headers
+_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+
 
 class WorkflowStatus(str, Enum):
     """Enum for Logic App workflow run statuses."""
@@ -39,6 +49,8 @@ class LogicAppConfig(BaseModel):
         timeout: Request timeout in seconds.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     workflow_url: str = Field(..., description="Logic App HTTP trigger URL")
     subscription_id: Optional[str] = Field(None, description="Azure subscription ID")
     resource_group: Optional[str] = Field(None, description="Resource group name")
@@ -52,12 +64,12 @@ class LogicAppConfig(BaseModel):
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Validate that the URL is properly formatted."""
-        if not v.startswith(("http://", "https://")):
+        if not v.startswith(URL_SCHEMES):
             raise ValueError("workflow_url must start with http:// or https://")
         return v
 
 
-class LogicAppsClient:
+class LogicAppsClient(PooledHttpClient):
     """Client for interacting with Azure Logic Apps.
 
     This client provides methods for triggering Logic App workflows
@@ -71,15 +83,24 @@ class LogicAppsClient:
         >>> result = client.trigger_workflow({"action": "process", "data": "test"})
     """
 
-    def __init__(self, config: LogicAppConfig) -> None:
+    def __init__(
+        self,
+        config: LogicAppConfig,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         """Initialize the Logic Apps client.
 
         :param config: Configuration object containing workflow endpoint and settings.
+        :param circuit_breaker: Breaker guarding calls to the workflow. A new one
+            with default thresholds is created if not given.
         :raises ValueError: If configuration is invalid.
         """
         try:
             self.config = config
             self._credential: Optional[DefaultAzureCredential] = None
+            super().__init__(
+                f"Logic App workflow {config.workflow_url}", circuit_breaker
+            )
 
             if self.config.use_managed_identity:
                 self._credential = DefaultAzureCredential()
@@ -87,17 +108,15 @@ class LogicAppsClient:
             else:
                 logger.info("Initialized Logic Apps client with workflow URL")
         except Exception as e:
-            logger.error(f"Failed to initialize Logic Apps client: {str(e)}")
+            logger.error("Failed to initialize Logic Apps client: %s", e)
             raise ValueError(f"Client initialization failed: {str(e)}") from e
 
-    def _get_headers(self) -> Dict[str, str]:
+    def _get_headers(self) -> Mapping[str, str]:
         """Get HTTP headers for the request.
 
-        :return: Dictionary containing standard HTTP headers.
+        :return: Read-only mapping containing standard HTTP headers.
         """
-        headers = {"Content-Type": "application/json"}
-        logger.debug("Prepared request headers")
-        return headers
+        return _HEADERS
 
     def trigger_workflow(
         self, payload: Dict[str, Any], wait_for_completion: bool = False
@@ -107,30 +126,38 @@ class LogicAppsClient:
         :param payload: JSON payload to send to the workflow trigger.
         :param wait_for_completion: Whether to wait for workflow completion before returning.
         :return: Response from the workflow trigger or final status if waiting.
-        :raises requests.RequestException: If the HTTP request fails.
+        :raises CircuitOpenError: If recent failures have opened the circuit.
+        :raises requests.RequestException: If the payload cannot be serialized to
+            JSON (InvalidJSONError) or the HTTP request fails.
         :raises ValueError: If the response cannot be parsed as JSON.
         """
-        logger.info(f"Triggering Logic App workflow: {self.config.workflow_url}")
-        logger.debug(
-            f"Payload keys: {list(payload.keys())}, wait_for_completion: {wait_for_completion}"
-        )
+        logger.info("Triggering Logic App workflow: %s", self.config.workflow_url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Payload keys: %s, wait_for_completion: %s",
+                list(payload),
+                wait_for_completion,
+            )
+        body = self._encode_payload(payload)
+        self._check_circuit()
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 url=self.config.workflow_url,
-                json=payload,
+                data=body,
                 headers=self._get_headers(),
                 timeout=self.config.timeout,
             )
             response.raise_for_status()
+            self._breaker.record_success()
 
             try:
-                result = response.json()
+                result = orjson.loads(response.content)
             except ValueError:
                 result = {"status": "triggered", "status_code": response.status_code}
 
             logger.info(
-                f"Workflow triggered successfully. Status: {response.status_code}"
+                "Workflow triggered successfully. Status: %s", response.status_code
             )
 
             if wait_for_completion:
@@ -141,7 +168,8 @@ class LogicAppsClient:
             return result
 
         except requests.RequestException as e:
-            logger.error(f"Failed to trigger Logic App workflow: {str(e)}")
+            self._breaker.record_failure(getattr(e.response, "status_code", None))
+            logger.error("Failed to trigger Logic App workflow: %s", e)
             raise
 
     async def trigger_workflow_async(
@@ -149,6 +177,8 @@ class LogicAppsClient:
     ) -> Dict[str, Any]:
         """Trigger a Logic App workflow asynchronously.
 
+        Unlike trigger_workflow, failed requests are not retried.
+
         Args:
             payload: JSON payload to send to the workflow.
             wait_for_completion: If True, wait for the workflow to complete.
@@ -157,46 +187,52 @@ class LogicAppsClient:
             Response from the workflow trigger or final status if waiting.
 
         Raises:
+            CircuitOpenError: If recent failures have opened the circuit.
             aiohttp.ClientError: If the request fails.
+            TypeError: If the payload cannot be serialized to JSON.
+            asyncio.TimeoutError: If the request times out.
         """
         logger.info(
-            f"Triggering Logic App workflow asynchronously: {self.config.workflow_url}"
-        )
-        logger.debug(
-            f"Payload keys: {list(payload.keys())}, wait_for_completion: {wait_for_completion}"
+            "Triggering Logic App workflow asynchronously: %s", self.config.workflow_url
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Payload keys: %s, wait_for_completion: %s",
+                list(payload),
+                wait_for_completion,
+            )
+        self._check_circuit()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url=self.config.workflow_url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                ) as response:
-                    response.raise_for_status()
-
-                    # Try to parse JSON response, but handle empty responses
-                    try:
-                        result = await response.json()
-                    except ValueError:
-                        result = {"status": "triggered", "status_code": response.status}
-
-                    logger.info(
-                        f"Async workflow triggered successfully. Status: {response.status}"
-                    )
+            async with (await self._get_async_session()).post(
+                url=self.config.workflow_url,
+                json=payload,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            ) as response:
+                response.raise_for_status()
+                self._breaker.record_success()
+
+                # Try to parse JSON response, but handle empty responses
+                try:
+                    result = await response.json(loads=orjson.loads)
+                except ValueError:
+                    result = {"status": "triggered", "status_code": response.status}
+
+                logger.info(
+                    "Async workflow triggered successfully. Status: %s", response.status
+                )
 
-                    if wait_for_completion:
-                        logger.warning(
-                            "wait_for_completion requires management API access (not implemented)"
-                        )
+                if wait_for_completion:
+                    logger.warning(
+                        "wait_for_completion requires management API access (not implemented)"
+                    )
 
-                    return result
+                return result
 
-        except aiohttp.ClientError as e:
-            logger.error(
-                f"Failed to trigger Logic App workflow asynchronously: {str(e)}"
-            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure(getattr(e, "status", None))
+            logger.error("Failed to trigger Logic App workflow asynchronously: %s", e)
             raise
 
 
@@ -238,7 +274,7 @@ class WorkflowOrchestrator:
         Returns:
             Result from the workflow execution.
         """
-        logger.info(f"Executing workflow of type '{workflow_type}'")
+        logger.info("Executing workflow of type '%s'", workflow_type)
 
         try:
             result = self.client.trigger_workflow(
@@ -248,10 +284,10 @@ class WorkflowOrchestrator:
                     "timestamp": self._get_timestamp(),
                 }
             )
-            logger.info(f"Workflow '{workflow_type}' executed successfully")
+            logger.info("Workflow '%s' executed successfully", workflow_type)
             return result
         except Exception as e:
-            logger.error(f"Workflow '{workflow_type}' execution failed: {str(e)}")
+            logger.error("Workflow '%s' execution failed: %s", workflow_type, e)
             raise
 
     @staticmethod
@@ -261,8 +297,6 @@ class WorkflowOrchestrator:
         Returns:
             ISO formatted timestamp string.
         """
-        from datetime import datetime, timezone
-
         return datetime.now(timezone.utc).isoformat()
 
 
@@ -307,7 +341,9 @@ class NotificationWorkflow:
         Returns:
             Result from the notification workflow.
         """
-        logger.info(f"Sending notification to '{recipient}' with subject '{subject}'")
+        logger.info(
+            "Sending notification to '%s' with subject '%s'", recipient, subject
+        )
 
         try:
             result = self.client.trigger_workflow(
@@ -319,8 +355,8 @@ class NotificationWorkflow:
                     "priority": priority,
                 }
             )
-            logger.info(f"Notification sent successfully to '{recipient}'")
+            logger.info("Notification sent successfully to '%s'", recipient)
             return result
         except Exception as e:
-            logger.error(f"Failed to send notification to '{recipient}': {str(e)}")
+            logger.error("Failed to send notification to '%s': %s", recipient, e)
             raise
@@ -5,8 +5,13 @@ This module provides integration between Microsoft Agent Framework and Azure ser
 (Functions and Logic Apps) as agent tools.
 """
 
+import functools
+import inspect
 import logging
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from azure.ai.projects import AIProjectClient
 from azure.ai.projects.models import FunctionTool
@@ -14,10 +19,123 @@ from azure.identity import DefaultAzureCredential
 from pydantic import BaseModel, Field
 
 from src.abstractions.azure_functions import AzureFunctionsClient, FunctionConfig
+from src.abstractions.http_client import PooledHttpClient
 from src.abstractions.logic_apps import LogicAppsClient, LogicAppConfig
 
 logger = logging.getLogger(__name__)
 
+# AIProjectClient is thread-safe, so agents targeting the same project share one
+# client (and its HTTP pipeline) per process instead of rebuilding it each time.
+_CLIENT_CACHE: Dict[str, AIProjectClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# One credential (and its token cache) serves every project client, so the
+# credential chain is probed once per process rather than once per client.
+_SHARED_CREDENTIAL: Optional[DefaultAzureCredential] = None
+
+# Conversation threads for the current context (sync call chain or asyncio task),
+# so consecutive run_agent calls continue one thread instead of opening a new one.
+# Keyed by (project_endpoint, agent_id) so agents and projects never share a
+# thread. The mapping is replaced, never mutated, so copied contexts stay isolated.
+_current_threads: ContextVar[Mapping[Tuple[str, str], str]] = ContextVar(
+    "foundry_threads", default=MappingProxyType({})
+)
+
+# Tool parameter schemas are identical for every registration of a given tool
+# kind, so they are built once here rather than per register_* call.
+_AZURE_FUNCTION_TOOL_PARAMETERS: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "payload": {
+            "type": "object",
+            "description": "JSON payload to send to the Azure Function",
+        }
+    },
+    "required": ["payload"],
+}
+_LOGIC_APP_TOOL_PARAMETERS: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "payload": {
+            "type": "object",
+            "description": "JSON payload to send to the Logic App workflow",
+        }
+    },
+    "required": ["payload"],
+}
+
+
+def _get_credential() -> DefaultAzureCredential:
+    """Get the process-wide DefaultAzureCredential, creating it on first use.
+
+    Callers must hold _CLIENT_CACHE_LOCK.
+
+    :return: The shared credential instance.
+    """
+    global _SHARED_CREDENTIAL
+    if _SHARED_CREDENTIAL is None:
+        _SHARED_CREDENTIAL = DefaultAzureCredential()
+        logger.debug("Created shared DefaultAzureCredential")
+    return _SHARED_CREDENTIAL
+
+
+def _remember_thread(key: Tuple[str, str], thread_id: str) -> None:
+    """Record the conversation thread for an agent in the current context.
+
+    :param key: The (project_endpoint, agent_id) pair the thread belongs to.
+    :param thread_id: The thread to continue on later run_agent calls.
+    """
+    threads = dict(_current_threads.get())
+    threads[key] = thread_id
+    _current_threads.set(MappingProxyType(threads))
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_latest_message(list_messages: Callable) -> bool:
+    """Check whether an SDK's list_messages accepts the order and limit arguments.
+
+    Cached per function, so each SDK version is inspected once per process.
+
+    :param list_messages: The list_messages function (unbound, where available).
+    :return: True if order and limit can be passed by keyword.
+    """
+    try:
+        parameters = inspect.signature(list_messages).parameters
+    except (TypeError, ValueError):
+        return False
+    return all(
+        name in parameters
+        and parameters[name].kind
+        in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        for name in ("order", "limit")
+    )
+
+
+def _wrap_tool_call(
+    name: str, kind: str, invoke: Callable[[Dict[str, Any]], Dict[str, Any]]
+) -> Callable[..., Dict[str, Any]]:
+    """Wrap a client call as an agent tool callable.
+
+    :param name: Unique identifier for the tool.
+    :param kind: Human-readable tool kind used in log messages (e.g. "Logic App").
+    :param invoke: Client method that takes the tool arguments as a payload dict.
+    :return: Tool callable that returns failures as an error dict instead of raising.
+    """
+
+    def tool_function(**kwargs: Any) -> Dict[str, Any]:
+        """Wrapper function for remote tool invocation."""
+        logger.info("Invoking %s tool: %s", kind, name)
+        try:
+            result = invoke(kwargs)
+            logger.info("%s tool '%s' executed successfully", kind, name)
+            return result
+        except Exception as e:
+            logger.error("%s tool '%s' failed: %s", kind, name, e)
+            return {"error": str(e), "status": "failed"}
+
+    tool_function.__name__ = name
+    return tool_function
+
 
 class AgentConfig(BaseModel):
     """Configuration for the AI Foundry agent using Microsoft Agent Framework.
@@ -68,6 +186,18 @@ class FoundryAgent:
         >>> response = agent.run_agent(agent_id, "Process this data: [1, 2, 3]")
     """
 
+    # Fixed attribute layout: no per-instance __dict__ for multi-agent processes.
+    # Subclasses that add attributes must declare their own __slots__.
+    __slots__ = (
+        "config",
+        "_tools",
+        "_function_tools",
+        "_clients",
+        "_eager_threads",
+        "_client",
+        "_registry_lock",
+    )
+
     def __init__(self, config: AgentConfig) -> None:
         """Initialize the Foundry Agent with Microsoft Agent Framework.
 
@@ -76,20 +206,84 @@ class FoundryAgent:
         """
         self.config = config
         self._tools: Dict[str, Callable] = {}
-        self._function_tools: List[FunctionTool] = []
+        self._function_tools: Dict[str, FunctionTool] = {}
+        self._clients: List[PooledHttpClient] = []
+        self._eager_threads: Dict[str, str] = {}
+        self._registry_lock = threading.Lock()
 
         try:
-            credential = DefaultAzureCredential()
-            self._client = AIProjectClient(
-                endpoint=self.config.project_endpoint, credential=credential
-            )
+            self._client = self._get_project_client(self.config.project_endpoint)
             logger.info(
-                f"Initialized Foundry Agent with project: {self.config.project_endpoint}"
+                "Initialized Foundry Agent with project: %s",
+                self.config.project_endpoint,
             )
         except Exception as e:
-            logger.error(f"Failed to initialize Foundry Agent: {str(e)}")
+            logger.error("Failed to initialize Foundry Agent: %s", e)
             raise ValueError(f"Agent initialization failed: {str(e)}") from e
 
+    @staticmethod
+    def _get_project_client(endpoint: str) -> AIProjectClient:
+        """Get the shared AIProjectClient for a project endpoint.
+
+        :param endpoint: Azure AI Foundry project endpoint URL.
+        :return: The cached client for the endpoint, created on first use.
+        """
+        client = _CLIENT_CACHE.get(endpoint)
+        if client is None:
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(endpoint)
+                if client is None:
+                    client = AIProjectClient(
+                        endpoint=endpoint, credential=_get_credential()
+                    )
+                    _CLIENT_CACHE[endpoint] = client
+                    logger.debug("Created AIProjectClient for project: %s", endpoint)
+        return client
+
+    @classmethod
+    def clear_client_cache(cls) -> None:
+        """Drop all cached AIProjectClient instances and the shared credential.
+
+        Cached clients are not closed, since other agents may still hold them.
+        Intended for tests and for picking up rotated credentials.
+        """
+        global _SHARED_CREDENTIAL
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE.clear()
+            _SHARED_CREDENTIAL = None
+        logger.info("Cleared AIProjectClient cache")
+
+    def _add_tool(
+        self,
+        name: str,
+        function: Callable,
+        function_tool: FunctionTool,
+        client: Optional[PooledHttpClient] = None,
+    ) -> None:
+        """Store a tool's callable and definition, replacing any tool of the same name.
+
+        The HTTP client of a replaced tool stays open until close(), since calls
+        made through an earlier tools snapshot may still be using it.
+
+        :param name: Unique identifier for the tool.
+        :param function: Callable that implements the tool logic.
+        :param function_tool: Tool definition sent to the agent service.
+        :param client: HTTP client owned by the tool, closed by close().
+        """
+        # Copy-on-write: readers (create_agent, iter_tools) always see a complete
+        # snapshot without locking, and concurrent registrations do not race.
+        with self._registry_lock:
+            if name in self._function_tools:
+                logger.debug("Replacing previously registered tool: %s", name)
+            tools = dict(self._tools)
+            tools[name] = function
+            function_tools = dict(self._function_tools)
+            function_tools[name] = function_tool
+            self._tools = tools
+            self._function_tools = function_tools
+            if client is not None:
+                self._clients.append(client)
+
     def register_azure_function_tool(
         self, name: str, config: FunctionConfig, description: Optional[str] = None
     ) -> None:
@@ -102,40 +296,20 @@ class FoundryAgent:
         """
         try:
             client = AzureFunctionsClient(config)
-
-            def tool_function(**kwargs: Any) -> Dict[str, Any]:
-                """Wrapper function for Azure Function invocation."""
-                logger.info(f"Invoking Azure Function tool: {name}")
-                try:
-                    result = client.invoke_function(kwargs)
-                    logger.info(f"Azure Function tool '{name}' executed successfully")
-                    return result
-                except Exception as e:
-                    logger.error(f"Azure Function tool '{name}' failed: {str(e)}")
-                    return {"error": str(e), "status": "failed"}
-
-            tool_function.__name__ = name
-            self._tools[name] = tool_function
+            tool_function = _wrap_tool_call(
+                name, "Azure Function", client.invoke_function
+            )
 
             function_tool = FunctionTool(
                 name=name,
                 description=description
                 or f"Azure Function tool: {name} - Invokes Azure Function at {config.function_url}",
-                parameters={
-                    "type": "object",
-                    "properties": {
-                        "payload": {
-                            "type": "object",
-                            "description": "JSON payload to send to the Azure Function",
-                        }
-                    },
-                    "required": ["payload"],
-                },
+                parameters=_AZURE_FUNCTION_TOOL_PARAMETERS,
             )
-            self._function_tools.append(function_tool)
-            logger.info(f"Registered Azure Function tool: {name}")
+            self._add_tool(name, tool_function, function_tool, client)
+            logger.info("Registered Azure Function tool: %s", name)
         except Exception as e:
-            logger.error(f"Failed to register Azure Function tool '{name}': {str(e)}")
+            logger.error("Failed to register Azure Function tool '%s': %s", name, e)
             raise ValueError(
                 f"Azure Function tool registration failed for '{name}': {str(e)}"
             ) from e
@@ -152,40 +326,18 @@ class FoundryAgent:
         """
         try:
             client = LogicAppsClient(config)
-
-            def tool_function(**kwargs: Any) -> Dict[str, Any]:
-                """Wrapper function for Logic App workflow invocation."""
-                logger.info(f"Invoking Logic App tool: {name}")
-                try:
-                    result = client.trigger_workflow(kwargs)
-                    logger.info(f"Logic App tool '{name}' executed successfully")
-                    return result
-                except Exception as e:
-                    logger.error(f"Logic App tool '{name}' failed: {str(e)}")
-                    return {"error": str(e), "status": "failed"}
-
-            tool_function.__name__ = name
-            self._tools[name] = tool_function
+            tool_function = _wrap_tool_call(name, "Logic App", client.trigger_workflow)
 
             function_tool = FunctionTool(
                 name=name,
                 description=description
                 or f"Logic App workflow tool: {name} - Triggers workflow at {config.workflow_url}",
-                parameters={
-                    "type": "object",
-                    "properties": {
-                        "payload": {
-                            "type": "object",
-                            "description": "JSON payload to send to the Logic App workflow",
-                        }
-                    },
-                    "required": ["payload"],
-                },
+                parameters=_LOGIC_APP_TOOL_PARAMETERS,
             )
-            self._function_tools.append(function_tool)
-            logger.info(f"Registered Logic App tool: {name}")
+            self._add_tool(name, tool_function, function_tool, client)
+            logger.info("Registered Logic App tool: %s", name)
         except Exception as e:
-            logger.error(f"Failed to register Logic App tool '{name}': {str(e)}")
+            logger.error("Failed to register Logic App tool '%s': %s", name, e)
             raise ValueError(
                 f"Logic App tool registration failed for '{name}': {str(e)}"
             ) from e
@@ -206,85 +358,176 @@ class FoundryAgent:
         :raises ValueError: If tool registration fails.
         """
         try:
-            self._tools[name] = function
             function_tool = FunctionTool(
                 name=name, description=description, parameters=parameters
             )
-            self._function_tools.append(function_tool)
-            logger.info(f"Registered custom tool: {name}")
+            self._add_tool(name, function, function_tool)
+            logger.info("Registered custom tool: %s", name)
         except Exception as e:
-            logger.error(f"Failed to register custom tool '{name}': {str(e)}")
+            logger.error("Failed to register custom tool '%s': %s", name, e)
             raise ValueError(
                 f"Custom tool registration failed for '{name}': {str(e)}"
             ) from e
 
-    def create_agent(self, name: Optional[str] = None) -> str:
+    def create_agent(self, name: Optional[str] = None, eager_init: bool = False) -> str:
         """Create an agent with registered tools using Microsoft Agent Framework.
 
         :param name: Optional custom name for the agent. Defaults to "Azure Tools Agent".
+        :param eager_init: Whether to open a conversation thread right away, so the
+            first run_agent call skips thread creation and the client pipeline is
+            already warm. The first run_agent call for this agent that has no
+            thread of its own takes over this thread; later contexts get new ones.
         :return: The unique identifier of the created agent.
         :raises RuntimeError: If agent creation fails due to API errors or invalid configuration.
         """
         agent_name = name or "Azure Tools Agent"
-        logger.info(f"Creating agent: {agent_name}")
+        logger.info("Creating agent: %s with %s tools", agent_name, self.tool_count)
 
         try:
             agent = self._client.agents.create_agent(
                 model=self.config.model_name,
                 name=agent_name,
                 instructions=self.config.instructions,
-                tools=self._function_tools,
+                tools=list(self._function_tools.values()),
                 tool_resources={},
             )
-            logger.info(f"Agent created with ID: {agent.id}")
-            return agent.id
+            logger.info("Agent created with ID: %s", agent.id)
         except Exception as e:
-            logger.error(f"Failed to create agent '{agent_name}': {str(e)}")
+            logger.error("Failed to create agent '%s': %s", agent_name, e)
             raise RuntimeError(f"Agent creation failed: {str(e)}") from e
 
+        if eager_init:
+            try:
+                thread = self._client.agents.create_thread()
+                self._eager_threads[agent.id] = thread.id
+                logger.info("Pre-created thread: %s", thread.id)
+            except Exception as e:
+                logger.warning("Eager thread creation failed: %s", e)
+
+        return agent.id
+
     def run_agent(
-        self, agent_id: str, user_message: str, thread_id: Optional[str] = None
+        self,
+        agent_id: str,
+        user_message: str,
+        thread_id: Optional[str] = None,
+        new_thread: bool = False,
     ) -> str:
         """Run the agent with a user message.
 
         :param agent_id: The unique identifier of the agent to execute.
         :param user_message: The user's input message or query.
         :param thread_id: Optional thread ID for maintaining conversation context across multiple turns.
+            Defaults to the thread last used by run_agent for this agent and project in
+            the current context, then to the not yet used thread opened by
+            create_agent(eager_init=True), if any. Request handlers on pooled worker threads should call
+            end_conversation() (or pass new_thread=True) when a new user session starts.
+        :param new_thread: Whether to start a fresh conversation instead of reusing a
+            remembered thread. Has no effect when thread_id is given.
         :return: The agent's response text.
         :raises RuntimeError: If agent execution fails or encounters API errors.
         """
-        logger.info(f"Running agent {agent_id} with message: {user_message[:50]}...")
+        logger.info("Running agent %s with message: %.50s...", agent_id, user_message)
 
-        try:
+        thread_key = (self.config.project_endpoint, agent_id)
+        if not new_thread and not thread_id:
+            thread_id = _current_threads.get().get(thread_key)
             if not thread_id:
-                thread = self._client.agents.create_thread()
-                thread_id = thread.id
-                logger.info(f"Created new thread: {thread_id}")
-
-            self._client.agents.create_message(
-                thread_id=thread_id, role="user", content=user_message
-            )
+                # The eager thread serves only the first conversation that needs one
+                thread_id = self._eager_threads.pop(agent_id, None)
+                if thread_id:
+                    _remember_thread(thread_key, thread_id)
 
-            run = self._client.agents.create_and_process_run(
-                thread_id=thread_id, agent_id=agent_id
-            )
-
-            logger.info(f"Agent run completed with status: {run.status}")
-
-            messages = self._client.agents.list_messages(thread_id=thread_id)
+        try:
+            agents = self._client.agents
+
+            if not thread_id and hasattr(agents, "create_thread_and_process_run"):
+                # New conversation: create the thread, post the message and run
+                # the agent in one request instead of three
+                run = agents.create_thread_and_process_run(
+                    agent_id=agent_id,
+                    thread={"messages": [{"role": "user", "content": user_message}]},
+                )
+                thread_id = run.thread_id
+                _remember_thread(thread_key, thread_id)
+                logger.info("Created new thread: %s", thread_id)
+            else:
+                if not thread_id:
+                    thread = agents.create_thread()
+                    thread_id = thread.id
+                    _remember_thread(thread_key, thread_id)
+                    logger.info("Created new thread: %s", thread_id)
+
+                agents.create_message(
+                    thread_id=thread_id, role="user", content=user_message
+                )
+
+                run = agents.create_and_process_run(
+                    thread_id=thread_id, agent_id=agent_id
+                )
+
+            logger.info("Agent run completed with status: %s", run.status)
+
+            # Only the newest message is needed; avoid paging in the whole thread
+            list_messages = agents.list_messages
+            if _supports_latest_message(
+                getattr(list_messages, "__func__", list_messages)
+            ):
+                messages = list_messages(thread_id=thread_id, order="desc", limit=1)
+            else:
+                messages = list_messages(thread_id=thread_id)
 
             for message in messages:
                 if message.role == "assistant":
-                    content = message.content[0]
-                    if hasattr(content, "text"):
-                        return content.text.value
+                    for content in message.content:
+                        text = getattr(content, "text", None)
+                        if text is not None:
+                            return text.value
 
             logger.warning("No assistant response found in messages")
             return "No response generated"
         except Exception as e:
-            logger.error(f"Failed to run agent {agent_id}: {str(e)}")
+            logger.error("Failed to run agent %s: %s", agent_id, e)
             raise RuntimeError(f"Agent execution failed: {str(e)}") from e
 
+    def end_conversation(self, agent_id: Optional[str] = None) -> None:
+        """Forget the threads remembered for this agent's project in the current context.
+
+        Unused threads from create_agent(eager_init=True) are dropped as well, so
+        the next run_agent call always starts a new conversation. Call this at the
+        start of each request when serving users from pooled worker threads.
+
+        :param agent_id: Agent whose thread to forget. Defaults to every agent on
+            this agent's project.
+        """
+        if agent_id is None:
+            self._eager_threads.clear()
+        else:
+            self._eager_threads.pop(agent_id, None)
+
+        endpoint = self.config.project_endpoint
+        threads = _current_threads.get()
+        remaining = {
+            key: thread
+            for key, thread in threads.items()
+            if key[0] != endpoint or (agent_id is not None and key[1] != agent_id)
+        }
+        if len(remaining) != len(threads):
+            _current_threads.set(MappingProxyType(remaining))
+
+    def close(self) -> None:
+        """Close the HTTP clients created for Azure Function and Logic App tools.
+
+        This includes clients of tools that were since replaced.
+
+        The shared AIProjectClient is left open, since other agents may use it.
+        """
+        with self._registry_lock:
+            clients = self._clients
+            self._clients = []
+        for client in clients:
+            client.close()
+
     def list_tools(self) -> List[str]:
         """Get a list of all registered tools.
 
@@ -292,6 +535,30 @@ class FoundryAgent:
         """
         return list(self._tools.keys())
 
+    @property
+    def tools(self) -> Mapping[str, Callable]:
+        """Read-only snapshot of the registered tool callables, keyed by name.
+
+        Registration replaces the underlying dict, so tools registered later do
+        not appear in an earlier snapshot; read the property again to see them.
+        """
+        return MappingProxyType(self._tools)
+
+    @property
+    def tool_count(self) -> int:
+        """Number of tools currently registered with the agent."""
+        return len(self._tools)
+
+    def iter_tools(self) -> Iterator[str]:
+        """Iterate over registered tool names without copying them.
+
+        Prefer this over list_tools() when only looping over the names. The
+        iterator walks a snapshot, so registering tools meanwhile is safe.
+
+        :return: Iterator over the registered tool names.
+        """
+        return iter(self._tools)
+
     def delete_agent(self, agent_id: str) -> None:
         """Delete an agent.
 
@@ -300,7 +567,8 @@ class FoundryAgent:
         """
         try:
             self._client.agents.delete_agent(agent_id)
-            logger.info(f"Deleted agent: {agent_id}")
+            self._eager_threads.pop(agent_id, None)
+            logger.info("Deleted agent: %s", agent_id)
         except Exception as e:
-            logger.error(f"Failed to delete agent {agent_id}: {str(e)}")
+            logger.error("Failed to delete agent %s: %s", agent_id, e)
             raise RuntimeError(f"Agent deletion failed: {str(e)}") from e
@@ -4,11 +4,19 @@ This module defines MCP tools that can be consumed by AI agents like GitHub Copi
 We're exposing the data analysis functionality from Lab 1 as MCP tools.
 """
 
-import json
 import logging
 import azure.functions as func
+import orjson
 from typing import Any, Dict, List
 
+
+def _dumps(data: Any) -> str:
+    """Serialize tool output with orjson (C fast path)."""
+    return orjson.dumps(data).decode()
+
+
+_loads = orjson.loads
+
 app = func.FunctionApp(http_auth_level=func.AuthLevel.FUNCTION)
 
 # ============================================================================
@@ -35,26 +43,46 @@ class ToolProperty:
 tool_properties_analyze_data = [
     ToolProperty("values", "string", "A JSON array of numbers to analyze, e.g., [1, 2, 3, 4, 5]")
 ]
-tool_properties_analyze_data_json = json.dumps([p.to_dict() for p in tool_properties_analyze_data])
+tool_properties_analyze_data_json = _dumps([p.to_dict() for p in tool_properties_analyze_data])
 
 # Tool properties for save_snippet
 tool_properties_save_snippet = [
     ToolProperty("snippet_name", "string", "The name to save the snippet under"),
     ToolProperty("snippet_content", "string", "The code snippet content to save")
 ]
-tool_properties_save_snippet_json = json.dumps([p.to_dict() for p in tool_properties_save_snippet])
+tool_properties_save_snippet_json = _dumps([p.to_dict() for p in tool_properties_save_snippet])
 
 # Tool properties for get_snippet
 tool_properties_get_snippet = [
     ToolProperty("snippet_name", "string", "The name of the snippet to retrieve")
 ]
-tool_properties_get_snippet_json = json.dumps([p.to_dict() for p in tool_properties_get_snippet])
+tool_properties_get_snippet_json = _dumps([p.to_dict() for p in tool_properties_get_snippet])
+
+# Tool properties for get_snippets
+tool_properties_get_snippets = [
+    ToolProperty("snippet_names", "string", "A JSON array of snippet names to retrieve, e.g., [\"a\", \"b\"]")
+]
+tool_properties_get_snippets_json = _dumps([p.to_dict() for p in tool_properties_get_snippets])
+
+# Constant validation errors, serialized once instead of on every bad call
+_ERROR_NO_VALUES = _dumps({"error": "No values provided"})
+_ERROR_NO_SNIPPET_NAME = _dumps({"error": "No snippet name provided"})
+_ERROR_NO_SNIPPET_CONTENT = _dumps({"error": "No snippet content provided"})
+_ERROR_NO_SNIPPET_NAMES = _dumps({"error": "No snippet names provided"})
+_ERROR_INVALID_SNIPPET_NAMES = _dumps({"error": "snippet_names must be a JSON array of strings"})
 
 
 # ============================================================================
 # MCP Tool: hello_mcp
 # ============================================================================
 
+# The greeting never changes, so serialize it once at import
+_HELLO_MCP_RESPONSE = _dumps({
+    "message": "Hello from MCP Server! 👋",
+    "status": "success",
+    "lab": "Lab 4 - MCP Server with Azure Functions"
+})
+
 @app.generic_trigger(
     arg_name="context",
     type="mcpToolTrigger",
@@ -68,11 +96,7 @@ def hello_mcp(context) -> str:
     Returns a greeting message to verify the MCP server is working.
     """
     logging.info("hello_mcp tool invoked")
-    return json.dumps({
-        "message": "Hello from MCP Server! 👋",
-        "status": "success",
-        "lab": "Lab 4 - MCP Server with Azure Functions"
-    })
+    return _HELLO_MCP_RESPONSE
 
 
 # ============================================================================
@@ -95,14 +119,14 @@ def analyze_data(context) -> str:
     logging.info("analyze_data MCP tool invoked")
 
     try:
-        content = json.loads(context)
+        content = _loads(context)
         values_str = content["arguments"].get("values", "[]")
 
         # Parse the values (they come as a JSON string)
-        values = json.loads(values_str) if isinstance(values_str, str) else values_str
+        values = _loads(values_str) if isinstance(values_str, str) else values_str
 
         if not values:
-            return json.dumps({"error": "No values provided"})
+            return _ERROR_NO_VALUES
 
         # Perform the analysis (same as Lab 1)
         result = {
@@ -115,11 +139,11 @@ def analyze_data(context) -> str:
         }
 
         logging.info(f"Analysis complete: {result}")
-        return json.dumps(result)
+        return _dumps(result)
 
     except Exception as e:
         logging.error(f"Error in analyze_data: {str(e)}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 # ============================================================================
@@ -143,21 +167,21 @@ def save_snippet(context) -> str:
     logging.info("save_snippet MCP tool invoked")
 
     try:
-        content = json.loads(context)
+        content = _loads(context)
         snippet_name = content["arguments"].get("snippet_name", "")
         snippet_content = content["arguments"].get("snippet_content", "")
 
         if not snippet_name:
-            return json.dumps({"error": "No snippet name provided"})
+            return _ERROR_NO_SNIPPET_NAME
 
         if not snippet_content:
-            return json.dumps({"error": "No snippet content provided"})
+            return _ERROR_NO_SNIPPET_CONTENT
 
         # Save the snippet
         _snippets_storage[snippet_name] = snippet_content
 
         logging.info(f"Saved snippet: {snippet_name}")
-        return json.dumps({
+        return _dumps({
             "message": f"Snippet '{snippet_name}' saved successfully",
             "snippet_name": snippet_name,
             "status": "success"
@@ -165,7 +189,7 @@ def save_snippet(context) -> str:
 
     except Exception as e:
         logging.error(f"Error in save_snippet: {str(e)}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 # ============================================================================
@@ -186,14 +210,14 @@ def get_snippet(context) -> str:
     logging.info("get_snippet MCP tool invoked")
 
     try:
-        content = json.loads(context)
+        content = _loads(context)
         snippet_name = content["arguments"].get("snippet_name", "")
 
         if not snippet_name:
-            return json.dumps({"error": "No snippet name provided"})
+            return _ERROR_NO_SNIPPET_NAME
 
         if snippet_name not in _snippets_storage:
-            return json.dumps({
+            return _dumps({
                 "error": f"Snippet '{snippet_name}' not found",
                 "available_snippets": list(_snippets_storage.keys())
             })
@@ -201,7 +225,7 @@ def get_snippet(context) -> str:
         snippet_content = _snippets_storage[snippet_name]
 
         logging.info(f"Retrieved snippet: {snippet_name}")
-        return json.dumps({
+        return _dumps({
             "snippet_name": snippet_name,
             "content": snippet_content,
             "status": "success"
@@ -209,7 +233,61 @@ def get_snippet(context) -> str:
 
     except Exception as e:
         logging.error(f"Error in get_snippet: {str(e)}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
+
+
+# ============================================================================
+# MCP Tool: get_snippets (batch)
+# ============================================================================
+
+@app.generic_trigger(
+    arg_name="context",
+    type="mcpToolTrigger",
+    toolName="get_snippets",
+    description="Retrieve several saved code snippets by name in a single call.",
+    toolProperties=tool_properties_get_snippets_json
+)
+def get_snippets(context) -> str:
+    """
+    Retrieve multiple code snippets from storage in one invocation.
+
+    Batching lookups amortizes the per-invocation Functions host overhead
+    across all requested snippets instead of paying it once per name.
+    """
+    logging.info("get_snippets MCP tool invoked")
+
+    try:
+        content = _loads(context)
+        names = content["arguments"].get("snippet_names", "[]")
+
+        # Parse the names (they come as a JSON string)
+        snippet_names = _loads(names) if isinstance(names, str) else names
+
+        if not snippet_names:
+            return _ERROR_NO_SNIPPET_NAMES
+
+        # A bare JSON string would otherwise be iterated character by character
+        if not isinstance(snippet_names, list) or not all(isinstance(name, str) for name in snippet_names):
+            return _ERROR_INVALID_SNIPPET_NAMES
+
+        snippets = [
+            {"snippet_name": name, "content": _snippets_storage[name]}
+            for name in snippet_names
+            if name in _snippets_storage
+        ]
+        missing = [name for name in snippet_names if name not in _snippets_storage]
+
+        logging.info(f"Retrieved {len(snippets)} snippets, {len(missing)} missing")
+        return _dumps({
+            "snippets": snippets,
+            "count": len(snippets),
+            "missing": missing,
+            "status": "success"
+        })
+
+    except Exception as e:
+        logging.error(f"Error in get_snippets: {str(e)}")
+        return _dumps({"error": str(e)})
 
 
 # ============================================================================
@@ -229,7 +307,7 @@ def list_snippets(context) -> str:
     """
     logging.info("list_snippets MCP tool invoked")
 
-    return json.dumps({
+    return _dumps({
         "snippets": list(_snippets_storage.keys()),
         "count": len(_snippets_storage),
         "status": "success"
@@ -1,9 +1,17 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import pytest
+from aiohttp import web
+
+from src.abstractions.azure_functions import AzureFunctionsClient, FunctionConfig
+from src.abstractions.logic_apps import LogicAppConfig, LogicAppsClient
 
 # Configure logging for tests
 logging.basicConfig(
@@ -11,31 +19,63 @@ logging.basicConfig(
 )
 
 
-@pytest.fixture
-def sample_function_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_function_config() -> Mapping[str, Any]:
     """Provide sample Azure Function configuration.
 
+    Shared across the session, so it is read-only; use .copy() to vary it.
+
     Returns:
-        Dictionary with function configuration.
+        Read-only mapping with function configuration.
     """
-    return {
-        "function_url": "https://test.azurewebsites.net/api/testfunction",
-        "function_key": "test_key_123",
-        "timeout": 30,
-    }
+    return MappingProxyType(
+        {
+            "function_url": "https://test.azurewebsites.net/api/testfunction",
+            "function_key": "test_key_123",
+            "timeout": 30,
+        }
+    )
 
 
-@pytest.fixture
-def sample_logic_app_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_logic_app_config() -> Mapping[str, Any]:
     """Provide sample Logic App configuration.
 
+    Shared across the session, so it is read-only; use .copy() to vary it.
+
     Returns:
-        Dictionary with Logic App configuration.
+        Read-only mapping with Logic App configuration.
     """
-    return {
-        "workflow_url": "https://prod-test.eastus.logic.azure.com:443/workflows/test",
-        "timeout": 60,
-    }
+    return MappingProxyType(
+        {
+            "workflow_url": "https://prod-test.eastus.logic.azure.com:443/workflows/test",
+            "timeout": 60,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def function_config(sample_function_config: Mapping[str, Any]) -> FunctionConfig:
+    """Provide a validated Azure Function configuration.
+
+    The model is frozen, so one instance is safely shared by every test.
+
+    Returns:
+        FunctionConfig built from the sample configuration.
+    """
+    return FunctionConfig(**sample_function_config)
+
+
+@pytest.fixture(scope="session")
+def logic_app_config(sample_logic_app_config: Mapping[str, Any]) -> LogicAppConfig:
+    """Provide a validated Logic App configuration.
+
+    The model is frozen, so one instance is safely shared by every test.
+
+    Returns:
+        LogicAppConfig built from the sample configuration.
+    """
+    return LogicAppConfig(**sample_logic_app_config)
 
 
 @pytest.fixture
@@ -60,3 +100,85 @@ def mock_response_data() -> Dict[str, Any]:
         "result": "processed",
         "data": {"output": "test_output"},
     }
+
+
+@pytest.fixture
+def azure_functions_client(
+    function_config: FunctionConfig,
+) -> Iterator[AzureFunctionsClient]:
+    """Provide an Azure Functions client for the sample configuration.
+
+    Yields:
+        Client whose pooled session is closed after the test.
+    """
+    with AzureFunctionsClient(function_config) as client:
+        yield client
+
+
+@pytest.fixture
+def logic_apps_client(logic_app_config: LogicAppConfig) -> Iterator[LogicAppsClient]:
+    """Provide a Logic Apps client for the sample configuration.
+
+    Yields:
+        Client whose pooled session is closed after the test.
+    """
+    with LogicAppsClient(logic_app_config) as client:
+        yield client
+
+
+class LocalServer:
+    """JSON echo server running on a background thread.
+
+    Requests are echoed back with status 200 unless a response has been
+    scripted for the path with ``script``.
+    """
+
+    def __init__(self, port: int) -> None:
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.hits: Counter = Counter()
+        self._scripted: Dict[str, List[Tuple[int, Dict[str, str]]]] = defaultdict(list)
+
+    def url(self, path: str) -> str:
+        """Get the absolute URL of a path on the server."""
+        return f"{self.base_url}{path}"
+
+    def script(
+        self, path: str, status: int, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Answer the next request to a path with an empty response."""
+        self._scripted[path].append((status, dict(headers or {})))
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Record the hit and echo the body or play back a scripted response."""
+        self.hits[request.path] += 1
+        if self._scripted[request.path]:
+            status, headers = self._scripted[request.path].pop(0)
+            return web.Response(status=status, headers=headers)
+        return web.json_response(await request.json())
+
+
+@pytest.fixture
+def local_server(unused_tcp_port: int) -> Iterator[LocalServer]:
+    """Provide a local HTTP server for end-to-end client tests.
+
+    Yields:
+        Server accepting POST requests on any path.
+    """
+    server = LocalServer(unused_tcp_port)
+    app = web.Application()
+    app.router.add_post("/{path:.*}", server.handle)
+    runner = web.AppRunner(app, access_log=None)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", unused_tcp_port)
+    loop.run_until_complete(site.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
@@ -0,0 +1,344 @@
+"""Unit tests for the Foundry agent core."""
+
+import contextvars
+import itertools
+from types import MappingProxyType
+from typing import Dict, Iterator
+from unittest.mock import MagicMock, create_autospec, patch
+
+import pytest
+
+import src.agent_core as agent_core
+from src.abstractions.azure_functions import AzureFunctionsClient, FunctionConfig
+from src.agent_core import AgentConfig, FoundryAgent
+
+
+def _make_project_client(endpoint: str, credential: object) -> MagicMock:
+    """Build a mocked AIProjectClient whose threads are named after the project."""
+    client = MagicMock(name=f"AIProjectClient({endpoint})")
+    agents = client.agents
+    counter = itertools.count(1)
+
+    def create_thread_and_process_run(**kwargs: object) -> MagicMock:
+        return MagicMock(thread_id=f"{endpoint}-thread{next(counter)}")
+
+    def create_thread() -> MagicMock:
+        return MagicMock(id=f"{endpoint}-thread{next(counter)}")
+
+    agents.create_thread_and_process_run.side_effect = create_thread_and_process_run
+    agents.create_thread.side_effect = create_thread
+    agent_ids = itertools.count(1)
+    agents.create_agent.side_effect = lambda **kwargs: MagicMock(
+        id=f"agent{next(agent_ids)}"
+    )
+
+    message = MagicMock(role="assistant")
+    message.content = [MagicMock()]
+    message.content[0].text.value = "response"
+    agents.list_messages.return_value = [message]
+    return client
+
+
+@pytest.fixture(autouse=True)
+def project_client_factory() -> Iterator[MagicMock]:
+    """Patch AIProjectClient and the credential, and reset module-level state.
+
+    Yields:
+        The patched AIProjectClient class.
+    """
+    token = agent_core._current_threads.set(MappingProxyType({}))
+    agent_core._CLIENT_CACHE.clear()
+    agent_core._SHARED_CREDENTIAL = None
+    with patch.object(
+        agent_core, "AIProjectClient", side_effect=_make_project_client
+    ) as factory, patch.object(agent_core, "DefaultAzureCredential"):
+        yield factory
+    agent_core._CLIENT_CACHE.clear()
+    agent_core._SHARED_CREDENTIAL = None
+    agent_core._current_threads.reset(token)
+
+
+def _agent(endpoint: str = "https://p1") -> FoundryAgent:
+    return FoundryAgent(AgentConfig(project_endpoint=endpoint))
+
+
+def _posted_threads(agent: FoundryAgent) -> Dict[str, int]:
+    """Count create_message calls per thread on the agent's project client."""
+    counts: Dict[str, int] = {}
+    for call in agent._client.agents.create_message.call_args_list:
+        thread = call.kwargs["thread_id"]
+        counts[thread] = counts.get(thread, 0) + 1
+    return counts
+
+
+@pytest.mark.unit
+class TestConversationThreads:
+    """Tests for conversation thread reuse in run_agent."""
+
+    def test_thread_reused_for_same_agent(self) -> None:
+        """Test that consecutive runs of one agent continue one thread."""
+        agent = _agent()
+
+        agent.run_agent("agent-a", "first")
+        agent.run_agent("agent-a", "second")
+
+        assert _posted_threads(agent) == {"https://p1-thread1": 1}
+
+    def test_agents_do_not_share_thread(self) -> None:
+        """Test that two agents on one project get separate threads."""
+        agent = _agent()
+
+        agent.run_agent("agent-a", "first")
+        agent.run_agent("agent-b", "first")
+        agent.run_agent("agent-b", "second")
+
+        assert _posted_threads(agent) == {"https://p1-thread2": 1}
+
+    def test_projects_do_not_share_thread(self) -> None:
+        """Test that agents on different projects never reuse each other's thread."""
+        first = _agent("https://p1")
+        second = _agent("https://p2")
+
+        first.run_agent("agent-a", "first")
+        second.run_agent("agent-a", "first")
+        second.run_agent("agent-a", "second")
+
+        assert _posted_threads(first) == {}
+        assert _posted_threads(second) == {"https://p2-thread1": 1}
+
+    def test_end_conversation(self) -> None:
+        """Test that end_conversation makes the next run open a new thread."""
+        agent = _agent()
+        agent.run_agent("agent-a", "first")
+
+        agent.end_conversation("agent-a")
+        agent.run_agent("agent-a", "second")
+
+        create = agent._client.agents.create_thread_and_process_run
+        assert create.call_count == 2
+        assert _posted_threads(agent) == {}
+
+    @pytest.mark.parametrize("run_first", [True, False])
+    def test_end_conversation_after_eager_init(self, run_first: bool) -> None:
+        """Test that end_conversation also retires the eagerly created thread."""
+        agent = _agent()
+        agent_id = agent.create_agent(eager_init=True)
+        if run_first:
+            agent.run_agent(agent_id, "first")
+
+        agent.end_conversation(agent_id)
+        agent.run_agent(agent_id, "second")
+
+        create = agent._client.agents.create_thread_and_process_run
+        create.assert_called_once()
+        assert agent._client.agents.create_message.call_count == int(run_first)
+
+    def test_eager_thread_keyed_by_agent(self) -> None:
+        """Test that an eagerly created thread is only reused by its own agent."""
+        agent = _agent()
+        eager_id = agent.create_agent(eager_init=True)
+        other_id = agent.create_agent()
+
+        agent.run_agent(eager_id, "first")
+        agent.run_agent(other_id, "first")
+
+        assert _posted_threads(agent) == {"https://p1-thread1": 1}
+
+        agent.delete_agent(eager_id)
+        assert agent._eager_threads == {}
+
+    def test_eager_thread_used_by_first_conversation_only(self) -> None:
+        """Test that the eager thread is handed to one context, not every context."""
+        agent = _agent()
+        agent_id = agent.create_agent(eager_init=True)
+
+        contextvars.copy_context().run(agent.run_agent, agent_id, "first")
+        contextvars.copy_context().run(agent.run_agent, agent_id, "second")
+
+        assert _posted_threads(agent) == {"https://p1-thread1": 1}
+        assert agent._client.agents.create_thread_and_process_run.call_count == 1
+
+    def test_new_thread_starts_fresh_conversation(self) -> None:
+        """Test that new_thread skips the remembered thread and replaces it."""
+        agent = _agent()
+        agent.run_agent("agent-a", "first")
+
+        agent.run_agent("agent-a", "second", new_thread=True)
+        agent.run_agent("agent-a", "third")
+
+        assert _posted_threads(agent) == {"https://p1-thread2": 1}
+
+    def test_new_thread_ignored_with_explicit_thread(self) -> None:
+        """Test that an explicit thread_id wins over new_thread."""
+        agent = _agent()
+
+        agent.run_agent("agent-a", "hello", thread_id="existing", new_thread=True)
+
+        assert _posted_threads(agent) == {"existing": 1}
+
+
+@pytest.mark.unit
+class TestProjectClientCache:
+    """Tests for the shared AIProjectClient cache."""
+
+    def test_client_shared_per_endpoint(
+        self, project_client_factory: MagicMock
+    ) -> None:
+        """Test that agents on one project share a client and others get their own."""
+        first = _agent("https://p1")
+        second = _agent("https://p1")
+        third = _agent("https://p2")
+
+        assert first._client is second._client
+        assert third._client is not first._client
+        assert project_client_factory.call_count == 2
+
+    def test_clear_client_cache(self, project_client_factory: MagicMock) -> None:
+        """Test that clearing the cache makes the next agent build a new client."""
+        first = _agent()
+
+        FoundryAgent.clear_client_cache()
+        second = _agent()
+
+        assert second._client is not first._client
+        assert project_client_factory.call_count == 2
+
+    def test_clear_client_cache_resets_credential(self) -> None:
+        """Test that clearing the cache also drops the shared credential."""
+        _agent("https://p1")
+        _agent("https://p2")
+        assert agent_core.DefaultAzureCredential.call_count == 1
+
+        FoundryAgent.clear_client_cache()
+        assert agent_core._SHARED_CREDENTIAL is None
+        _agent()
+
+        assert agent_core.DefaultAzureCredential.call_count == 2
+
+
+@pytest.mark.unit
+class TestRunAgent:
+    """Tests for FoundryAgent.run_agent."""
+
+    def test_new_conversation_uses_single_call(self) -> None:
+        """Test that a new conversation is started with create_thread_and_process_run."""
+        agent = _agent()
+        agents = agent._client.agents
+
+        assert agent.run_agent("agent-a", "hello") == "response"
+
+        agents.create_thread_and_process_run.assert_called_once_with(
+            agent_id="agent-a",
+            thread={"messages": [{"role": "user", "content": "hello"}]},
+        )
+        agents.create_thread.assert_not_called()
+        agents.create_message.assert_not_called()
+        agents.create_and_process_run.assert_not_called()
+
+    def test_new_conversation_fallback(self) -> None:
+        """Test the three-call path when the SDK lacks create_thread_and_process_run."""
+        agent = _agent()
+        agents = agent._client.agents
+        del agents.create_thread_and_process_run
+
+        assert agent.run_agent("agent-a", "hello") == "response"
+
+        agents.create_thread.assert_called_once_with()
+        agents.create_message.assert_called_once_with(
+            thread_id="https://p1-thread1", role="user", content="hello"
+        )
+        agents.create_and_process_run.assert_called_once_with(
+            thread_id="https://p1-thread1", agent_id="agent-a"
+        )
+
+    def test_reply_fetches_latest_message_only(self) -> None:
+        """Test that only the newest message is listed when the SDK supports it."""
+        agent = _agent()
+        agents = agent._client.agents
+        agents.list_messages = create_autospec(
+            lambda thread_id, *, order=None, limit=None: None,
+            return_value=agents.list_messages.return_value,
+        )
+
+        assert agent.run_agent("agent-a", "hello") == "response"
+
+        agents.list_messages.assert_called_once_with(
+            thread_id="https://p1-thread1", order="desc", limit=1
+        )
+
+    def test_reply_fetch_fallback(self) -> None:
+        """Test that SDKs without order and limit get the plain list call."""
+        agent = _agent()
+        agents = agent._client.agents
+        agents.list_messages = create_autospec(
+            lambda thread_id: None, return_value=agents.list_messages.return_value
+        )
+
+        assert agent.run_agent("agent-a", "hello") == "response"
+
+        agents.list_messages.assert_called_once_with(thread_id="https://p1-thread1")
+
+    def test_reply_fetch_type_error_propagates(self) -> None:
+        """Test that a TypeError raised by the SDK is not retried unbounded."""
+        agent = _agent()
+        agents = agent._client.agents
+        agents.list_messages = create_autospec(
+            lambda thread_id, *, order=None, limit=None: None,
+            side_effect=TypeError("bad response"),
+        )
+
+        with pytest.raises(RuntimeError, match="bad response"):
+            agent.run_agent("agent-a", "hello")
+        agents.list_messages.assert_called_once()
+
+
+_PARAMETERS: Dict[str, object] = {"type": "object", "properties": {}}
+
+
+@pytest.mark.unit
+class TestToolRegistry:
+    """Tests for tool registration."""
+
+    def test_reregister_replaces_tool(self) -> None:
+        """Test that registering a name again replaces the earlier tool."""
+        agent = _agent()
+        first = MagicMock(name="first")
+        second = MagicMock(name="second")
+
+        agent.register_custom_tool("echo", first, "First echo", _PARAMETERS)
+        agent.register_custom_tool("echo", second, "Second echo", _PARAMETERS)
+        agent.create_agent()
+
+        assert agent.list_tools() == ["echo"]
+        assert agent.tools["echo"] is second
+        tools = agent._client.agents.create_agent.call_args.kwargs["tools"]
+        assert len(tools) == 1
+
+    def test_registration_is_copy_on_write(self) -> None:
+        """Test that registering a tool leaves earlier snapshots unchanged."""
+        agent = _agent()
+        agent.register_custom_tool("first", MagicMock(), "First", _PARAMETERS)
+        snapshot = agent.tools
+        names = agent.iter_tools()
+
+        agent.register_custom_tool("second", MagicMock(), "Second", _PARAMETERS)
+
+        assert list(snapshot) == ["first"]
+        assert list(names) == ["first"]
+        assert list(agent.tools) == ["first", "second"]
+
+    def test_close_releases_tool_clients(self) -> None:
+        """Test that replaced tool clients stay open until the agent is closed."""
+        agent = _agent()
+        config = FunctionConfig(function_url="https://example.com/api/fn")
+
+        with patch.object(AzureFunctionsClient, "close", autospec=True) as close:
+            agent.register_azure_function_tool("fn", config)
+            agent.register_azure_function_tool("fn", config)
+            clients = list(agent._clients)
+            close.assert_not_called()
+
+            agent.close()
+
+        assert [call.args[0] for call in close.call_args_list] == clients
+        assert agent._clients == []
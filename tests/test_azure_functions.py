@@ -1,8 +1,16 @@
 """Unit tests for Azure Functions abstractions."""
 
+import asyncio
+import gc
+import json
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import requests
 from unittest.mock import Mock, patch, AsyncMock
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from src.abstractions.azure_functions import (
     FunctionConfig,
@@ -10,6 +18,12 @@ from src.abstractions.azure_functions import (
     DataProcessorFunction,
     IntegrationFunction,
 )
+from src.abstractions.circuit_breaker import CircuitState
+from src.abstractions.http_client import json_dumps
+from tests.conftest import LocalServer
+
+EXPECTED_HEADERS = {"Content-Type": "application/json"}
+INVALID_URLS = ["invalid-url", "", "ftp://example.com/api", "//example.com/api"]
 
 
 class TestFunctionConfig:
@@ -19,14 +33,16 @@ class TestFunctionConfig:
         """Test creating a valid function configuration."""
         config = FunctionConfig(**sample_function_config)
 
-        assert config.function_url == sample_function_config["function_url"]
-        assert config.function_key == sample_function_config["function_key"]
-        assert config.timeout == sample_function_config["timeout"]
+        assert (
+            config.model_dump(include=set(sample_function_config))
+            == sample_function_config
+        )
 
-    def test_invalid_url(self) -> None:
+    @pytest.mark.parametrize("url", INVALID_URLS)
+    def test_invalid_url(self, url: str) -> None:
         """Test that invalid URLs are rejected."""
         with pytest.raises(ValueError, match="must start with http"):
-            FunctionConfig(function_url="invalid-url", function_key="test_key")
+            FunctionConfig(function_url=url, function_key="test_key")
 
     def test_timeout_validation(self, sample_function_config: Dict[str, Any]) -> None:
         """Test timeout validation."""
@@ -37,22 +53,28 @@ class TestFunctionConfig:
         # Test with invalid timeout (too high)
         invalid_config = sample_function_config.copy()
         invalid_config["timeout"] = 500
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="less than or equal to 300"):
             FunctionConfig(**invalid_config)
 
+    def test_config_is_hashable(self, sample_function_config: Dict[str, Any]) -> None:
+        """Test that configs are immutable and usable as cache keys."""
+        config = FunctionConfig(**sample_function_config)
+
+        assert config == FunctionConfig(**sample_function_config)
+        assert len({config, FunctionConfig(**sample_function_config)}) == 1
+        with pytest.raises(ValueError, match="frozen"):
+            config.timeout = 10
+
 
 @pytest.mark.unit
 class TestAzureFunctionsClient:
     """Tests for AzureFunctionsClient."""
 
-    def test_initialization_with_key(
-        self, sample_function_config: Dict[str, Any]
-    ) -> None:
+    def test_initialization_with_key(self, function_config: FunctionConfig) -> None:
         """Test client initialization with function key."""
-        config = FunctionConfig(**sample_function_config)
-        client = AzureFunctionsClient(config)
+        client = AzureFunctionsClient(function_config)
 
-        assert client.config == config
+        assert client.config == function_config
         assert client._credential is None
 
     def test_initialization_with_managed_identity(
@@ -69,21 +91,52 @@ class TestAzureFunctionsClient:
 
             assert client._credential is not None
 
-    def test_get_headers(self, sample_function_config: Dict[str, Any]) -> None:
+    def test_get_headers(
+        self,
+        azure_functions_client: AzureFunctionsClient,
+        sample_function_config: Dict[str, Any],
+    ) -> None:
         """Test header generation."""
-        config = FunctionConfig(**sample_function_config)
-        client = AzureFunctionsClient(config)
+        headers = azure_functions_client._get_headers()
 
-        headers = client._get_headers()
+        assert headers == {
+            **EXPECTED_HEADERS,
+            "x-functions-key": sample_function_config["function_key"],
+        }
 
-        assert headers["Content-Type"] == "application/json"
-        assert headers["x-functions-key"] == sample_function_config["function_key"]
+    def test_session_retries_throttled_requests(
+        self, local_server: LocalServer, sample_payload: Dict[str, Any]
+    ) -> None:
+        """Test that a 503 response is retried and the next success returned."""
+        local_server.script("/api/fn", 503)
+        config = FunctionConfig(function_url=local_server.url("/api/fn"))
 
-    @patch("src.abstractions.azure_functions.requests.request")
+        with AzureFunctionsClient(config) as client:
+            assert client.invoke_function(sample_payload) == sample_payload
+
+        assert local_server.hits["/api/fn"] == 2
+
+    @patch("urllib3.util.retry.time.sleep")
+    def test_retry_after_is_capped(
+        self,
+        mock_sleep: Mock,
+        local_server: LocalServer,
+        sample_payload: Dict[str, Any],
+    ) -> None:
+        """Test that a long Retry-After does not stall the call beyond the cap."""
+        local_server.script("/api/fn", 429, {"Retry-After": "3600"})
+        config = FunctionConfig(function_url=local_server.url("/api/fn"))
+
+        with AzureFunctionsClient(config) as client:
+            assert client.invoke_function(sample_payload) == sample_payload
+
+        mock_sleep.assert_called_once_with(30)
+
+    @patch("src.abstractions.azure_functions.requests.Session.request")
     def test_invoke_function_success(
         self,
         mock_request: Mock,
-        sample_function_config: Dict[str, Any],
+        azure_functions_client: AzureFunctionsClient,
         sample_payload: Dict[str, Any],
         mock_response_data: Dict[str, Any],
     ) -> None:
@@ -91,22 +144,53 @@ class TestAzureFunctionsClient:
         # Setup mock
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_request.return_value = mock_response
 
         # Test
-        config = FunctionConfig(**sample_function_config)
-        client = AzureFunctionsClient(config)
-        result = client.invoke_function(sample_payload)
+        result = azure_functions_client.invoke_function(sample_payload)
 
         assert result == mock_response_data
         mock_request.assert_called_once()
+        assert (
+            mock_request.call_args.kwargs["headers"]
+            == azure_functions_client._get_headers()
+        )
+
+    @patch("src.abstractions.azure_functions.requests.Session.request")
+    def test_invoke_function_non_string_keys(
+        self,
+        mock_request: Mock,
+        azure_functions_client: AzureFunctionsClient,
+    ) -> None:
+        """Test that payloads with non-string keys are serialized like json.dumps."""
+        mock_request.return_value.content = b"{}"
+        payload = {1: "a", "nested": {2.5: True}}
+
+        azure_functions_client.invoke_function(payload)
+
+        sent = mock_request.call_args.kwargs["data"]
+        assert json.loads(sent) == json.loads(json.dumps(payload))
+        assert json.loads(json_dumps(payload)) == json.loads(json.dumps(payload))
+
+    @patch("src.abstractions.azure_functions.requests.Session.request")
+    def test_invoke_function_unserializable_payload(
+        self,
+        mock_request: Mock,
+        azure_functions_client: AzureFunctionsClient,
+    ) -> None:
+        """Test that an unserializable payload raises a RequestException up front."""
+        with pytest.raises(requests.exceptions.InvalidJSONError, match="serializable"):
+            azure_functions_client.invoke_function({"value": object()})
+
+        mock_request.assert_not_called()
+        assert azure_functions_client._breaker.state == CircuitState.CLOSED
 
-    @patch("src.abstractions.azure_functions.requests.request")
+    @patch("src.abstractions.azure_functions.requests.Session.request")
     def test_invoke_function_failure(
         self,
         mock_request: Mock,
-        sample_function_config: Dict[str, Any],
+        azure_functions_client: AzureFunctionsClient,
         sample_payload: Dict[str, Any],
     ) -> None:
         """Test function invocation failure."""
@@ -114,11 +198,8 @@ class TestAzureFunctionsClient:
         mock_request.side_effect = Exception("Connection error")
 
         # Test
-        config = FunctionConfig(**sample_function_config)
-        client = AzureFunctionsClient(config)
-
         with pytest.raises(Exception, match="Connection error"):
-            client.invoke_function(sample_payload)
+            azure_functions_client.invoke_function(sample_payload)
 
     @pytest.mark.asyncio
     @pytest.mark.skip(
@@ -128,7 +209,7 @@ class TestAzureFunctionsClient:
     async def test_invoke_function_async(
         self,
         mock_session: Mock,
-        sample_function_config: Dict[str, Any],
+        function_config: FunctionConfig,
         sample_payload: Dict[str, Any],
         mock_response_data: Dict[str, Any],
     ) -> None:
@@ -147,12 +228,40 @@ class TestAzureFunctionsClient:
         mock_response.__aexit__.return_value = None
 
         # Test
-        config = FunctionConfig(**sample_function_config)
-        client = AzureFunctionsClient(config)
+        client = AzureFunctionsClient(function_config)
         result = await client.invoke_function_async(sample_payload)
 
         assert result == mock_response_data
 
+    def test_async_sessions_per_event_loop(
+        self, local_server: LocalServer, sample_payload: Dict[str, Any]
+    ) -> None:
+        """Test async calls from successive and concurrent event loops on one client."""
+        client = AzureFunctionsClient(
+            FunctionConfig(function_url=local_server.url("/api/fn"))
+        )
+        both_threads_running = threading.Barrier(2)
+
+        async def invoke_batch(wait: bool = False) -> List[Dict[str, Any]]:
+            if wait:
+                both_threads_running.wait(timeout=5)
+            calls = (client.invoke_function_async(sample_payload) for _ in range(5))
+            return list(await asyncio.gather(*calls))
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            runs = [asyncio.run(invoke_batch()) for _ in range(2)]
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                runs += pool.map(lambda _: asyncio.run(invoke_batch(True)), range(2))
+            client.close()
+            gc.collect()
+
+        assert runs == [[sample_payload] * 5] * 4
+        assert local_server.hits["/api/fn"] == 20
+        assert [w.message for w in caught if w.category is ResourceWarning] == []
+        assert client._breaker.state == CircuitState.CLOSED
+        assert client._async_sessions == {}
+
 
 @pytest.mark.unit
 class TestDataProcessorFunction:
@@ -162,14 +271,13 @@ class TestDataProcessorFunction:
     def test_process_data(
         self,
         mock_invoke: Mock,
-        sample_function_config: Dict[str, Any],
+        function_config: FunctionConfig,
         mock_response_data: Dict[str, Any],
     ) -> None:
         """Test data processing."""
         mock_invoke.return_value = mock_response_data
 
-        config = FunctionConfig(**sample_function_config)
-        processor = DataProcessorFunction(config)
+        processor = DataProcessorFunction(function_config)
 
         result = processor.process_data({"test": "data"})
 
@@ -185,14 +293,13 @@ class TestIntegrationFunction:
     def test_call_external_service(
         self,
         mock_invoke: Mock,
-        sample_function_config: Dict[str, Any],
+        function_config: FunctionConfig,
         mock_response_data: Dict[str, Any],
     ) -> None:
         """Test external service call."""
         mock_invoke.return_value = mock_response_data
 
-        config = FunctionConfig(**sample_function_config)
-        integration = IntegrationFunction(config)
+        integration = IntegrationFunction(function_config)
 
         result = integration.call_external_service(
             service="test-service", params={"param": "value"}
@@ -200,3 +307,10 @@ class TestIntegrationFunction:
 
         assert result == mock_response_data
         mock_invoke.assert_called_once()
+
+
+def test_package_lazy_export() -> None:
+    """Test AzureFunctionsClient is re-exported from the package."""
+    from src.abstractions import AzureFunctionsClient as ExportedClient
+
+    assert ExportedClient is AzureFunctionsClient
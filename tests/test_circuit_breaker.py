@@ -0,0 +1,172 @@
+"""Unit tests for the circuit breaker abstraction."""
+
+import asyncio
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+import aiohttp
+import pytest
+import requests
+
+from src.abstractions.azure_functions import AzureFunctionsClient, FunctionConfig
+from src.abstractions.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from src.abstractions.logic_apps import LogicAppConfig, LogicAppsClient
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_invalid_settings(self) -> None:
+        """Test that non-positive settings are rejected."""
+        with pytest.raises(ValueError, match="failure_threshold"):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(ValueError, match="reset_timeout"):
+            CircuitBreaker(reset_timeout=0)
+
+    def test_opens_after_threshold(self) -> None:
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        breaker.record_failure()
+        breaker.record_failure(503)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+        breaker.record_failure(429)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test that a success clears earlier failures."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_client_errors_do_not_trip(self) -> None:
+        """Test that 4xx responses other than 429 count as healthy."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        breaker.record_failure(400)
+        breaker.record_failure(404)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @patch("src.abstractions.circuit_breaker.time.monotonic")
+    def test_half_open_trial(self, mock_monotonic: Mock) -> None:
+        """Test that one trial call is allowed after the cooldown."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    @patch("src.abstractions.circuit_breaker.time.monotonic")
+    def test_failed_trial_reopens(self, mock_monotonic: Mock) -> None:
+        """Test that a failed trial call opens the circuit again."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        for _ in range(3):
+            breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 140.0
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+
+@pytest.mark.unit
+class TestClientCircuitBreaker:
+    """Tests for circuit breaker integration in the clients."""
+
+    @patch("src.abstractions.azure_functions.requests.Session.request")
+    def test_open_circuit_skips_request(
+        self,
+        mock_request: Mock,
+        function_config: FunctionConfig,
+        sample_payload: Dict[str, Any],
+    ) -> None:
+        """Test that an open circuit rejects calls without network work."""
+        mock_request.side_effect = requests.ConnectionError("Connection refused")
+
+        client = AzureFunctionsClient(
+            function_config, circuit_breaker=CircuitBreaker(failure_threshold=2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                client.invoke_function(sample_payload)
+
+        with pytest.raises(CircuitOpenError):
+            client.invoke_function(sample_payload)
+        assert mock_request.call_count == 2
+
+    @patch("src.abstractions.logic_apps.requests.Session.post")
+    def test_open_circuit_skips_trigger(
+        self,
+        mock_post: Mock,
+        logic_app_config: LogicAppConfig,
+        sample_payload: Dict[str, Any],
+    ) -> None:
+        """Test that an open circuit rejects workflow triggers without network work."""
+        mock_post.side_effect = requests.Timeout("Request timed out")
+
+        client = LogicAppsClient(
+            logic_app_config, circuit_breaker=CircuitBreaker(failure_threshold=2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(requests.Timeout):
+                client.trigger_workflow(sample_payload)
+
+        with pytest.raises(CircuitOpenError):
+            client.trigger_workflow(sample_payload)
+        assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_failures_counted(
+        self,
+        function_config: FunctionConfig,
+        sample_payload: Dict[str, Any],
+    ) -> None:
+        """Test that async 5xx errors and timeouts trip the circuit but 4xx do not."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = AzureFunctionsClient(function_config, circuit_breaker=breaker)
+        session = Mock()
+        session.request.side_effect = [
+            aiohttp.ClientResponseError(Mock(), (), status=503),
+            aiohttp.ClientResponseError(Mock(), (), status=404),
+            aiohttp.ClientResponseError(Mock(), (), status=503),
+            asyncio.TimeoutError(),
+        ]
+
+        with patch.object(client, "_get_async_session", return_value=session):
+            for _ in range(3):
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await client.invoke_function_async(sample_payload)
+            assert breaker.state == CircuitState.CLOSED
+
+            with pytest.raises(asyncio.TimeoutError):
+                await client.invoke_function_async(sample_payload)
+            assert breaker.state == CircuitState.OPEN
+
+            with pytest.raises(CircuitOpenError):
+                await client.invoke_function_async(sample_payload)
+        assert session.request.call_count == 4
@@ -1,6 +1,9 @@
 """Unit tests for Logic Apps abstractions."""
 
+import json
+
 import pytest
+import requests
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any
 
@@ -11,6 +14,10 @@ from src.abstractions.logic_apps import (
     NotificationWorkflow,
     WorkflowStatus,
 )
+from tests.conftest import LocalServer
+
+EXPECTED_HEADERS = {"Content-Type": "application/json"}
+INVALID_URLS = ["invalid-url", "", "ftp://example.com/api", "//example.com/api"]
 
 
 class TestLogicAppConfig:
@@ -20,13 +27,16 @@ class TestLogicAppConfig:
         """Test creating a valid Logic App configuration."""
         config = LogicAppConfig(**sample_logic_app_config)
 
-        assert config.workflow_url == sample_logic_app_config["workflow_url"]
-        assert config.timeout == sample_logic_app_config["timeout"]
+        assert (
+            config.model_dump(include=set(sample_logic_app_config))
+            == sample_logic_app_config
+        )
 
-    def test_invalid_url(self) -> None:
+    @pytest.mark.parametrize("url", INVALID_URLS)
+    def test_invalid_url(self, url: str) -> None:
         """Test that invalid URLs are rejected."""
         with pytest.raises(ValueError, match="must start with http"):
-            LogicAppConfig(workflow_url="invalid-url")
+            LogicAppConfig(workflow_url=url)
 
     def test_timeout_validation(self, sample_logic_app_config: Dict[str, Any]) -> None:
         """Test timeout validation."""
@@ -37,20 +47,28 @@ class TestLogicAppConfig:
         # Test with invalid timeout (too high)
         invalid_config = sample_logic_app_config.copy()
         invalid_config["timeout"] = 1000
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="less than or equal to 600"):
             LogicAppConfig(**invalid_config)
 
+    def test_config_is_hashable(self, sample_logic_app_config: Dict[str, Any]) -> None:
+        """Test that configs are immutable and usable as cache keys."""
+        config = LogicAppConfig(**sample_logic_app_config)
+
+        assert config == LogicAppConfig(**sample_logic_app_config)
+        assert len({config, LogicAppConfig(**sample_logic_app_config)}) == 1
+        with pytest.raises(ValueError, match="frozen"):
+            config.timeout = 10
+
 
 @pytest.mark.unit
 class TestLogicAppsClient:
     """Tests for LogicAppsClient."""
 
-    def test_initialization(self, sample_logic_app_config: Dict[str, Any]) -> None:
+    def test_initialization(self, logic_app_config: LogicAppConfig) -> None:
         """Test client initialization."""
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
+        client = LogicAppsClient(logic_app_config)
 
-        assert client.config == config
+        assert client.config == logic_app_config
         assert client._credential is None
 
     def test_initialization_with_managed_identity(
@@ -66,20 +84,41 @@ class TestLogicAppsClient:
 
             assert client._credential is not None
 
-    def test_get_headers(self, sample_logic_app_config: Dict[str, Any]) -> None:
+    def test_get_headers(self, logic_apps_client: LogicAppsClient) -> None:
         """Test header generation."""
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
+        headers = logic_apps_client._get_headers()
+
+        assert headers == EXPECTED_HEADERS
+
+    def test_session_retries_throttled_requests(
+        self, local_server: LocalServer, sample_payload: Dict[str, Any]
+    ) -> None:
+        """Test that a 503 response is retried and the next success returned."""
+        local_server.script("/workflow", 503)
+        config = LogicAppConfig(workflow_url=local_server.url("/workflow"))
+
+        with LogicAppsClient(config) as client:
+            assert client.trigger_workflow(sample_payload) == sample_payload
+
+        assert local_server.hits["/workflow"] == 2
 
-        headers = client._get_headers()
+    @patch("src.abstractions.logic_apps.requests.Session.post")
+    def test_trigger_workflow_unserializable_payload(
+        self,
+        mock_post: Mock,
+        logic_apps_client: LogicAppsClient,
+    ) -> None:
+        """Test that an unserializable payload raises a RequestException up front."""
+        with pytest.raises(requests.exceptions.InvalidJSONError, match="serializable"):
+            logic_apps_client.trigger_workflow({"value": object()})
 
-        assert headers["Content-Type"] == "application/json"
+        mock_post.assert_not_called()
 
-    @patch("src.abstractions.logic_apps.requests.post")
+    @patch("src.abstractions.logic_apps.requests.Session.post")
     def test_trigger_workflow_success(
         self,
         mock_post: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_apps_client: LogicAppsClient,
         sample_payload: Dict[str, Any],
         mock_response_data: Dict[str, Any],
     ) -> None:
@@ -87,44 +126,40 @@ class TestLogicAppsClient:
         # Setup mock
         mock_response = Mock()
         mock_response.status_code = 202
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_post.return_value = mock_response
 
         # Test
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
-        result = client.trigger_workflow(sample_payload)
+        result = logic_apps_client.trigger_workflow(sample_payload)
 
         assert result == mock_response_data
         mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["headers"] == EXPECTED_HEADERS
 
-    @patch("src.abstractions.logic_apps.requests.post")
+    @patch("src.abstractions.logic_apps.requests.Session.post")
     def test_trigger_workflow_empty_response(
         self,
         mock_post: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_apps_client: LogicAppsClient,
         sample_payload: Dict[str, Any],
     ) -> None:
         """Test workflow trigger with empty response."""
         # Setup mock
         mock_response = Mock()
         mock_response.status_code = 202
-        mock_response.json.side_effect = ValueError("No JSON")
+        mock_response.content = b""
         mock_post.return_value = mock_response
 
         # Test
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
-        result = client.trigger_workflow(sample_payload)
+        result = logic_apps_client.trigger_workflow(sample_payload)
 
-        assert result["status"] == "triggered"
-        assert result["status_code"] == 202
+        assert result == {"status": "triggered", "status_code": 202}
 
-    @patch("src.abstractions.logic_apps.requests.post")
+    @patch("src.abstractions.logic_apps.requests.Session.post")
     def test_trigger_workflow_failure(
         self,
         mock_post: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_apps_client: LogicAppsClient,
         sample_payload: Dict[str, Any],
     ) -> None:
         """Test workflow trigger failure."""
@@ -132,11 +167,8 @@ class TestLogicAppsClient:
         mock_post.side_effect = Exception("Connection error")
 
         # Test
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
-
         with pytest.raises(Exception, match="Connection error"):
-            client.trigger_workflow(sample_payload)
+            logic_apps_client.trigger_workflow(sample_payload)
 
     @pytest.mark.asyncio
     @pytest.mark.skip(
@@ -146,7 +178,7 @@ class TestLogicAppsClient:
     async def test_trigger_workflow_async(
         self,
         mock_session: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_app_config: LogicAppConfig,
         sample_payload: Dict[str, Any],
         mock_response_data: Dict[str, Any],
     ) -> None:
@@ -165,8 +197,7 @@ class TestLogicAppsClient:
         mock_response.__aexit__.return_value = None
 
         # Test
-        config = LogicAppConfig(**sample_logic_app_config)
-        client = LogicAppsClient(config)
+        client = LogicAppsClient(logic_app_config)
         result = await client.trigger_workflow_async(sample_payload)
 
         assert result == mock_response_data
@@ -180,14 +211,13 @@ class TestWorkflowOrchestrator:
     def test_execute_workflow(
         self,
         mock_trigger: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_app_config: LogicAppConfig,
         mock_response_data: Dict[str, Any],
     ) -> None:
         """Test workflow execution."""
         mock_trigger.return_value = mock_response_data
 
-        config = LogicAppConfig(**sample_logic_app_config)
-        orchestrator = WorkflowOrchestrator(config)
+        orchestrator = WorkflowOrchestrator(logic_app_config)
 
         result = orchestrator.execute_workflow(
             workflow_type="approval", data={"request": "test"}
@@ -205,14 +235,13 @@ class TestNotificationWorkflow:
     def test_send_notification(
         self,
         mock_trigger: Mock,
-        sample_logic_app_config: Dict[str, Any],
+        logic_app_config: LogicAppConfig,
         mock_response_data: Dict[str, Any],
     ) -> None:
         """Test sending notification."""
         mock_trigger.return_value = mock_response_data
 
-        config = LogicAppConfig(**sample_logic_app_config)
-        notifier = NotificationWorkflow(config)
+        notifier = NotificationWorkflow(logic_app_config)
 
         result = notifier.send_notification(
             recipient="test@example.com", subject="Test", message="Test message"
@@ -229,3 +258,10 @@ def test_workflow_status_enum() -> None:
     assert WorkflowStatus.FAILED == "Failed"
     assert WorkflowStatus.CANCELLED == "Cancelled"
     assert WorkflowStatus.WAITING == "Waiting"
+
+
+def test_package_lazy_export() -> None:
+    """Test LogicAppsClient is re-exported from the package."""
+    from src.abstractions import LogicAppsClient as ExportedClient
+
+    assert ExportedClient is LogicAppsClient
@@ -0,0 +1,80 @@
+"""Unit tests for the MCP server function app tools."""
+
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+
+FUNCTION_APP_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "src"
+    / "tool_registry"
+    / "mcps"
+    / "src"
+    / "function_app.py"
+)
+
+
+@pytest.fixture(scope="module")
+def function_app() -> ModuleType:
+    """Load the MCP function app module from its deployment folder."""
+    spec = importlib.util.spec_from_file_location("mcp_function_app", FUNCTION_APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def tool_functions(function_app: ModuleType) -> Dict[str, Callable[[str], str]]:
+    """Map tool names to their user functions.
+
+    The app's function list can only be built once per FunctionApp.
+    """
+    return {
+        function.get_function_name(): function.get_user_function()
+        for function in function_app.app.get_functions()
+    }
+
+
+@pytest.fixture
+def tools(
+    function_app: ModuleType, tool_functions: Dict[str, Callable[[str], str]]
+) -> Iterator[Dict[str, Callable[[str], str]]]:
+    """Provide the tool functions with empty snippet storage."""
+    function_app._snippets_storage.clear()
+    yield tool_functions
+    function_app._snippets_storage.clear()
+
+
+def _call(tool: Callable[[str], str], **arguments: Any) -> Dict[str, Any]:
+    return json.loads(tool(json.dumps({"arguments": arguments})))
+
+
+@pytest.mark.unit
+class TestGetSnippets:
+    """Tests for the get_snippets MCP tool."""
+
+    def test_get_snippets(self, tools: Dict[str, Callable[[str], str]]) -> None:
+        """Test that found and missing snippets are reported separately."""
+        _call(tools["save_snippet"], snippet_name="a", snippet_content="print(1)")
+
+        result = _call(tools["get_snippets"], snippet_names='["a", "b"]')
+
+        assert result == {
+            "snippets": [{"snippet_name": "a", "content": "print(1)"}],
+            "count": 1,
+            "missing": ["b"],
+            "status": "success",
+        }
+
+    @pytest.mark.parametrize("names", ['"abc"', "5", '["a", 1]', 5, {"a": "b"}])
+    def test_invalid_snippet_names(
+        self, tools: Dict[str, Callable[[str], str]], names: Any
+    ) -> None:
+        """Test that anything but a list of strings is rejected with a fixed error."""
+        result = _call(tools["get_snippets"], snippet_names=names)
+
+        assert result == {"error": "snippet_names must be a JSON array of strings"}